@@ -30,9 +30,13 @@ the text to be displayed, namely:
 * :meth:`AboutDialog._create_authors_text`
 * :meth:`AboutDialog._create_debug_info_text`
 
-Each of these non-public methods returns a text that is set as text of the
-underlying display widget. Hence, you can use a reduced set of HTML tags to
-properly format the text.
+Each of these non-public methods returns a text that is set as rich (HTML)
+text of the underlying display widget. Hence, you can use a reduced set of HTML
+tags to properly format the text.
+
+Note that the texts are created only once per process and package name and
+cached afterwards (see :meth:`AboutDialog._rendered_text`), as they will
+usually not change while a GUI is running.
 
 Furthermore, if you need more control, you may think of using `Jinja
 <https://jinja.palletsprojects.com/>`_ as template engine.
@@ -42,69 +46,67 @@ Module documentation
 ====================
 
 """
+import functools
 from importlib import metadata
 import platform
-import string
-import subprocess  # noqa
-import sys
 
-from PySide6 import QtWidgets, QtGui
+from PySide6 import QtCore, QtWidgets, QtGui
 
 import qtbricks.utils
 
 ABOUT_STRING = """
 <p>
-${package_name} - Version ${package_version}
+{package_name} - Version {package_version}
 </p>
 
 <p>
-<em>${description}</em>
+<em>{description}</em>
 </p>
 
 <p>
-Website: <a href="${website}" title="Open ${website} in your preferred 
-browser (if configured).">${website}</a>
+Website: <a href="{website}" title="Open {website} in your preferred 
+browser (if configured).">{website}</a>
 </p>
 
 <p>
-License: ${package_name} is free software: you can redistribute it and/or 
-modify it under the terms of the <strong>${license} license</strong>.
+License: {package_name} is free software: you can redistribute it and/or 
+modify it under the terms of the <strong>{license} license</strong>.
 </p>
 """
 
 AUTHOR_STRING = """
 <p>
-The following people contributed to ${package_name}:
+The following people contributed to {package_name}:
 </p>
 
-${authors}
+{authors}
 
 You may contact the authors or maintainer(s) using the following email 
-address: <a href="mailto:${email}" title="Send email to ${email} 
-using your preferred email client (if configured).">${email}</a>.
+address: <a href="mailto:{email}" title="Send email to {email} 
+using your preferred email client (if configured).">{email}</a>.
 
 <hr />
 
 <p>
-License: ${package_name} is free software: you can redistribute it and/or 
-modify it under the terms of the <strong>${license} license</strong>.
+License: {package_name} is free software: you can redistribute it and/or 
+modify it under the terms of the <strong>{license} license</strong>.
 </p>
 """
 
 DEBUG_INFO_STRING = """
 <p>
-${package_name} - Version ${package_version}
+{package_name} - Version {package_version}
 </p>
 
 <p>
-OS: ${os}<br />
-CPU architecture: ${architecture}<br />
-Kernel: ${kernel}
+OS: {os}<br />
+CPU architecture: {architecture}<br />
+Kernel: {kernel}
 </p>
 
 <p>
-Python version: ${python_version}<br />
-PySide6 version: ${pyside6_version}
+Python version: {python_version}<br />
+PySide6 version: {pyside6_version}
 </p>
 
 <hr />
@@ -114,7 +116,7 @@ All installed Python packages:
 </p>
 
 <p>
-${all_packages}
+{all_packages}
 </p>
 """
 
@@ -159,27 +161,52 @@ class AboutDialog(QtWidgets.QDialog):
 
     """
 
+    _rendered_texts = {}
+
     def __init__(self, parent=None, package_name="", logo=""):
         super().__init__(parent)
 
         self.package_name = package_name
-        if logo:
-            self.logo = QtGui.QPixmap(logo)
-        else:
-            self.logo = QtGui.QPixmap(qtbricks.utils.image_path("icon.svg"))
+        self.logo = logo or qtbricks.utils.image_path("icon.svg")
 
         self._application_name = QtWidgets.QApplication.applicationName()
-        self._dialog_buttons = QtWidgets.QDialogButtonBox.Close
-        self._button_box = QtWidgets.QDialogButtonBox(self._dialog_buttons)
+        self._package_metadata = None
+        self._pyside6_metadata = None
+        self._button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Close, self
+        )
 
         self._top_layout = QtWidgets.QHBoxLayout()
         self._tab_widget = QtWidgets.QTabWidget()
-        self._tab_about = QtWidgets.QTextBrowser()
-        self._tab_authors = QtWidgets.QTextBrowser()
-        self._tab_debug_info = QtWidgets.QTextEdit()
+        self._tab_about = QtWidgets.QLabel()
+        self._tab_authors = QtWidgets.QLabel()
+        self._scroll_area_about = QtWidgets.QScrollArea()
+        self._scroll_area_authors = QtWidgets.QScrollArea()
+        self._tab_debug_info = QtWidgets.QTextBrowser()
+        self._ui_populated = False
+        self._debug_info_loaded = False
 
         self._setup_ui()
 
+    def showEvent(self, event):  # noqa N802
+        """
+        Actions performed when showing the dialog.
+
+        Reading the package metadata and creating the contents of the
+        dialog is deferred until the dialog is shown for the first time,
+        as there is no need to spend time on a dialog that is instantiated
+        but never shown.
+
+        Parameters
+        ----------
+        event : :class:`PySide6.QtGui.QShowEvent`
+            Event sent when showing the dialog
+
+        """
+        if not self._ui_populated:
+            self._populate_ui()
+        super().showEvent(event)
+
     def _setup_ui(self):
         """
         Setup the dialog window.
@@ -196,17 +223,36 @@ class AboutDialog(QtWidgets.QDialog):
         the class constructor. This comes with the advantage to separate
         the different tasks into methods.
         """
-        self._create_top_layout()
         self._add_tab_widgets()
         self._set_widget_properties()
         self._set_layout()
         self._connect_signals()
 
+    def _populate_ui(self):
+        """
+        Fill the dialog with the information about the package.
+
+        This method reads the package metadata and creates the top layout
+        as well as the texts of the tabs. It gets called when the dialog
+        is shown for the first time (see :meth:`showEvent`). The debug
+        information is only created once its tab gets shown (see
+        :meth:`_tab_changed`).
+        """
+        self._package_metadata = metadata.metadata(self.package_name)
+        self._pyside6_metadata = metadata.metadata("PySide6")
+        self._create_top_layout()
+        self._tab_about.setText(self._rendered_text(self._create_about_text))
+        self._tab_authors.setText(
+            self._rendered_text(self._create_authors_text)
+        )
+        self._ui_populated = True
+        self._tab_changed(self._tab_widget.currentIndex())
+
     def _create_top_layout(self):
-        package_metadata = metadata.metadata(self.package_name)
+        package_metadata = self._package_metadata
         version = package_metadata["Version"]
         icon = QtWidgets.QLabel()
-        icon.setPixmap(self.logo.scaledToHeight(60))
+        icon.setPixmap(self._logo_pixmap(height=60))
         text = QtWidgets.QLabel(
             f"<h1>{self.package_name}</h1>Version {version}"
         )
@@ -214,9 +260,39 @@ class AboutDialog(QtWidgets.QDialog):
         self._top_layout.addWidget(text)
         self._top_layout.addStretch(1)
 
+    def _logo_pixmap(self, height=60):
+        """
+        Read the logo scaled to the given height.
+
+        The logo is decoded directly at its final size, rather than
+        decoding it at full resolution and scaling the pixmap afterwards.
+        Hence, vector graphics are rendered crisply, and raster images are
+        scaled (up or down) to the given height.
+
+        Parameters
+        ----------
+        height : :class:`int`
+            Height of the logo in pixels
+
+        Returns
+        -------
+        pixmap : :class:`PySide6.QtGui.QPixmap`
+            Logo scaled to the given height, keeping its aspect ratio
+
+        """
+        reader = QtGui.QImageReader(self.logo)
+        size = reader.size()
+        if size.isValid() and size.height():
+            reader.setScaledSize(
+                QtCore.QSize(
+                    round(size.width() * height / size.height()), height
+                )
+            )
+        return QtGui.QPixmap.fromImage(reader.read())
+
     def _add_tab_widgets(self):
-        self._tab_widget.addTab(self._tab_about, "About")
-        self._tab_widget.addTab(self._tab_authors, "Authors")
+        self._tab_widget.addTab(self._scroll_area_about, "About")
+        self._tab_widget.addTab(self._scroll_area_authors, "Authors")
         self._tab_widget.addTab(self._tab_debug_info, "Debug info")
 
     def _set_widget_properties(self):
@@ -231,17 +307,21 @@ class AboutDialog(QtWidgets.QDialog):
         the class constructor.
         """
         self.setWindowTitle(f"About {self.package_name}")
-        self._tab_about.setOpenExternalLinks(True)
-        self._tab_about.setReadOnly(True)
-        self._tab_about.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self._tab_about.setText(self._create_about_text())
-        self._tab_authors.setOpenExternalLinks(True)
-        self._tab_authors.setReadOnly(True)
-        self._tab_authors.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self._tab_authors.setText(self._create_authors_text())
+        for label, scroll_area in (
+            (self._tab_about, self._scroll_area_about),
+            (self._tab_authors, self._scroll_area_authors),
+        ):
+            label.setTextFormat(QtCore.Qt.RichText)
+            label.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
+            label.setOpenExternalLinks(True)
+            label.setWordWrap(True)
+            label.setAlignment(QtCore.Qt.AlignTop)
+            scroll_area.setWidget(label)
+            scroll_area.setWidgetResizable(True)
+            scroll_area.setFrameShape(QtWidgets.QFrame.NoFrame)
         self._tab_debug_info.setReadOnly(True)
+        self._tab_debug_info.setUndoRedoEnabled(False)
         self._tab_debug_info.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self._tab_debug_info.setText(self._create_debug_info_text())
 
     def _set_layout(self):
         """
@@ -278,10 +358,61 @@ class AboutDialog(QtWidgets.QDialog):
         the class constructor.
         """
         self._button_box.rejected.connect(self.reject)
+        self._tab_widget.currentChanged.connect(self._tab_changed)
+
+    def _tab_changed(self, index):
+        """
+        Handle switching between the tabs of the dialog.
+
+        The debug information requires obtaining a list of all installed
+        packages, which is rather slow. Hence, the text is created only
+        once the user switches to the "Debug info" tab for the first time.
+
+        Parameters
+        ----------
+        index : :class:`int`
+            Index of the tab that has become the current tab
+
+        """
+        if (
+            self._ui_populated
+            and self._tab_widget.widget(index) is self._tab_debug_info
+            and not self._debug_info_loaded
+        ):
+            self._tab_debug_info.setHtml(
+                self._rendered_text(self._create_debug_info_text)
+            )
+            self._debug_info_loaded = True
+
+    def _rendered_text(self, create_text):
+        """
+        Return text created by the given method, rendering it only once.
+
+        The texts displayed in the tabs depend only on the package and do
+        not change during the lifetime of a process. Hence, they are
+        cached on the class level, with keys depending on the actual
+        class, the package name, and the method creating the text. Thus,
+        subclasses overriding one of the ``_create_*_text`` methods will
+        still get their own texts.
+
+        Parameters
+        ----------
+        create_text : :class:`callable`
+            (Bound) method returning the text
+
+        Returns
+        -------
+        text : :class:`str`
+            Text returned by the given method
+
+        """
+        key = (type(self), self.package_name, create_text.__name__)
+        if key not in self._rendered_texts:
+            self._rendered_texts[key] = create_text()
+        return self._rendered_texts[key]
 
     def _create_about_text(self):
-        package_metadata = metadata.metadata(self.package_name)
-        text = string.Template(ABOUT_STRING)
+        package_metadata = self._package_metadata
         substitutions = {
             "package_name": self.package_name,
             "package_version": package_metadata["Version"],
@@ -289,18 +420,17 @@ class AboutDialog(QtWidgets.QDialog):
             "website": package_metadata["Home-page"] or "http://example.org/",
             "license": package_metadata["License"],
         }
-        return text.substitute(substitutions)
+        return ABOUT_STRING.format_map(substitutions)
 
     def _create_authors_text(self):
-        package_metadata = metadata.metadata(self.package_name)
-        text = string.Template(AUTHOR_STRING)
+        package_metadata = self._package_metadata
         author_names = "<li>John Doe</li>\n"
         if "Author" in package_metadata:
-            author_names = [
-                f"<li>{name}</li>\n"
+            author_names = "".join(
+                f"<li>{name.strip()}</li>\n"
                 for name in package_metadata["Author"].split(",")
-            ]
-        authors = f"<ul>\n{author_names[0]}</ul>\n"
+            )
+        authors = f"<ul>\n{author_names}</ul>\n"
         if "Author-email" in package_metadata:
             email = package_metadata["Author-email"]
         else:
@@ -311,36 +441,30 @@ class AboutDialog(QtWidgets.QDialog):
             "email": email,
             "license": package_metadata["License"],
         }
-        return text.substitute(substitutions)
+        return AUTHOR_STRING.format_map(substitutions)
 
     def _create_debug_info_text(self):
-        package_metadata = metadata.metadata(self.package_name)
-        text = string.Template(DEBUG_INFO_STRING)
+        package_metadata = self._package_metadata
         substitutions = {
             "package_name": self.package_name,
             "package_version": package_metadata["Version"],
-            "os": platform.system(),
-            "architecture": platform.machine(),
-            "kernel": platform.release(),
-            "python_version": platform.python_version(),
-            "pyside6_version": metadata.metadata("PySide6")["Version"],
+            **_platform_info(),
+            "pyside6_version": self._pyside6_metadata["Version"],
             "all_packages": self._package_list(),
         }
-        return text.substitute(substitutions)
+        return DEBUG_INFO_STRING.format_map(substitutions)
 
     @staticmethod
     def _package_list():
         """
         Return list of all packages currently installed with version number.
 
-        There are several ways to get the result of "pip list"
-        programmatically from within Python. However, getting the version
-        numbers as well seems to require using the deprecated
-        ``pkg_resources``, as ``pkg_resources.working_set`` seems to have
-        no replacement in other modules. Hence, we rely here on calling
-        "pip list" directly from the command line and catching the output.
+        The list of packages is obtained using
+        :func:`importlib.metadata.distributions`, *i.e.* in-process,
+        rather than calling "pip list" in a separate process and parsing
+        its output. See :func:`_all_distributions` for details.
 
-        The output is reformatted for use in an HTML context. Hence,
+        The output is formatted for use in an HTML context. Hence,
         the method in its present form is not a general-purpose function.
 
         Returns
@@ -349,19 +473,65 @@ class AboutDialog(QtWidgets.QDialog):
             List of all packages currently installed
 
         """
-        args = [sys.executable, "-m", "pip", "list"]
-        process = subprocess.run(  # noqa
-            args,
-            check=True,
-            capture_output=True,
-        )
-        output = process.stdout.decode().split("\n")[2:]
         package_list = "<br />\n".join(
-            [": ".join(package.split()[0:2]) for package in output if output]
+            f"{name}: {version}" for name, version in _all_distributions()
         )
         return package_list
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_info():
+    """
+    Return information on the platform the application is running on.
+
+    As the platform does not change during the lifetime of a process,
+    the result is cached, *i.e.* only calculated on first call.
+
+    Returns
+    -------
+    platform_info : :class:`dict`
+        Operating system, CPU architecture, kernel, and Python version
+
+    """
+    return {
+        "os": platform.system(),
+        "architecture": platform.machine(),
+        "kernel": platform.release(),
+        "python_version": platform.python_version(),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _all_distributions():
+    """
+    Return names and versions of all distributions currently installed.
+
+    Enumerating the installed distributions is rather expensive,
+    as :mod:`importlib.metadata` scans all entries of ``sys.path`` and
+    parses the metadata of every package found. As the list of packages
+    will usually not change during the lifetime of a process, the result
+    is cached, *i.e.* only calculated on first call.
+
+    Packages are sorted by name, ignoring case, as done by "pip list".
+
+    Returns
+    -------
+    distributions : :class:`tuple`
+        Tuples of name and version of all distributions currently installed
+
+    """
+    return tuple(
+        sorted(
+            (
+                (distribution.metadata["Name"], distribution.version)
+                for distribution in metadata.distributions()
+                if distribution.metadata["Name"]
+            ),
+            key=lambda package: package[0].lower(),
+        )
+    )
+
+
 if __name__ == "__main__":
     app = QtWidgets.QApplication()
     app.setOrganizationName("qtbricks")
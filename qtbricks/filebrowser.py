@@ -105,7 +105,7 @@ Module documentation
 import os
 import sys
 
-from PySide6 import QtWidgets, QtCore, QtGui
+from PySide6 import QtWidgets, QtCore
 
 from qtbricks import utils
 
@@ -152,8 +152,8 @@ class FileBrowser(QtWidgets.QWidget):
     Double-clicking on a directory will change the root path to this
     directory.
 
-    Currently, the class has no public methods and only two public
-    attributes and a signal documented below.
+    Currently, the class has no public methods and only a public attribute,
+    a few properties, and a signal documented below.
 
     Parameters
     ----------
@@ -165,32 +165,47 @@ class FileBrowser(QtWidgets.QWidget):
     root_path : :class:`str`
         Root path set currently for the file browser
 
-    selection : :class:`list`
-        Names of the currently selected files
-
-        The names are the actual full paths to the file on the file system.
-
-        Thanks to using a list, the names should always appear in the order
-        they have been selected.
-
     """
 
-    selection_changed = QtCore.Signal(set)
+    selection_changed = QtCore.Signal(list)
     """
     Signal emitted when the selection of items changed.
 
-    The signal contains the selection as :class:`set` parameter.
+    The signal contains the selection as :class:`list` parameter.
     """
 
+    _BUTTONS = (
+        (
+            "_home_button",
+            "house.svg",
+            "Go to the home directory of the current user",
+        ),
+        (
+            "_up_button",
+            "circle-up.svg",
+            "Go one directory up in the hierarchy",
+        ),
+        (
+            "_back_button",
+            "circle-left.svg",
+            "Go back to the previous directory",
+        ),
+        (
+            "_forward_button",
+            "circle-right.svg",
+            "Revert going back to the previous directory",
+        ),
+    )
+
     def __init__(self, path=""):
         super().__init__()
 
         self.root_path = path or os.path.abspath(os.path.curdir)
-        self.selection = []
 
         self._previous_path = ""
         self._next_path = ""
         self._model_settings = {}
+        self._navigation_timer = QtCore.QTimer(self)
 
         self._home_button = QtWidgets.QPushButton()
         self._back_button = QtWidgets.QPushButton()
@@ -202,6 +217,24 @@ class FileBrowser(QtWidgets.QWidget):
         self._setup_ui()
         self._update_ui()
 
+    @property
+    def selection(self):
+        """
+        Names of the currently selected files.
+
+        The names are the actual full paths to the file on the file system.
+
+        Thanks to using a list, the names should always appear in the order
+        they have been selected.
+
+        Returns
+        -------
+        selection : :class:`list`
+            Names of the currently selected files
+
+        """
+        return self._tree_view.selection
+
     @property
     def model_settings(self):
         """
@@ -234,6 +267,22 @@ class FileBrowser(QtWidgets.QWidget):
             disable, but not hide the filtered out entries. Set to
             ``False`` in case you want to *hide* the entries entirely.
 
+        icons : :class:`bool`
+            Whether icons are displayed for the files and directories.
+
+            Obtaining the (platform-specific) icon for each entry can be
+            rather slow, particularly for large directories. Set to
+            ``False`` in case you do not need icons.
+
+        watch : :class:`bool`
+            Whether the file system is watched for changes.
+
+            By default, the model watches all directories visited for
+            changes and updates itself accordingly. For directories that do
+            not change while the file browser is used, this is unnecessary
+            overhead. Set to ``False`` in case you do not need to watch for
+            changes.
+
         Returns
         -------
         model_settings : :class:`dict`
@@ -263,24 +312,12 @@ class FileBrowser(QtWidgets.QWidget):
         self._connect_signals()
 
     def _set_widget_properties(self):
-        self._home_button.setIcon(QtGui.QIcon(utils.image_path("house.svg")))
-        self._home_button.setToolTip(
-            "Go to the home directory of the current user"
-        )
-        self._up_button.setIcon(
-            QtGui.QIcon(utils.image_path("circle-up.svg"))
-        )
-        self._up_button.setToolTip("Go one directory up in the hierarchy")
-        self._back_button.setIcon(
-            QtGui.QIcon(utils.image_path("circle-left.svg"))
-        )
-        self._back_button.setToolTip("Go back to the previous directory")
-        self._forward_button.setIcon(
-            QtGui.QIcon(utils.image_path("circle-right.svg"))
-        )
-        self._forward_button.setToolTip(
-            "Revert going back to the previous directory"
-        )
+        self._navigation_timer.setSingleShot(True)
+        self._navigation_timer.setInterval(50)
+        for attribute, icon, tooltip in self._BUTTONS:
+            button = getattr(self, attribute)
+            button.setIcon(utils.cached_icon(utils.image_path(icon)))
+            button.setToolTip(tooltip)
         self._curdir_edit.setText(self.root_path)
         self._curdir_edit.setCursorPosition(len(self._curdir_edit.text()))
         self._curdir_edit.setToolTip(
@@ -307,30 +344,29 @@ class FileBrowser(QtWidgets.QWidget):
         self._forward_button.pressed.connect(self._go_forward)
         self._curdir_edit.editingFinished.connect(self._change_path)
         self._tree_view.root_path_changed.connect(self._change_root_path)
-        self._tree_view.selection_changed.connect(self._change_selection)
+        self._tree_view.selection_changed.connect(self.selection_changed)
+        self._navigation_timer.timeout.connect(self._apply_root_path)
 
     def _change_path(self):
-        new_path = self._curdir_edit.text()
-        if os.path.exists(new_path):
-            self._change_root_path(new_path)
-        else:
-            self._curdir_edit.setText(self.root_path)
-
-    def _change_selection(self, selection: list):
-        self.selection_changed.emit(selection)
-        self.selection = selection
+        self._change_root_path(self._curdir_edit.text())
 
     def _change_root_path(self, path=""):
+        # Use the (cached) file system model rather than os.path.isdir()
+        model = self._tree_view.model()
+        index = model.index(path)
+        if not path or not index.isValid() or not model.isDir(index):
+            self._curdir_edit.setText(self.root_path)
+            return
+        path = os.path.normpath(path)
         if path == self.root_path:
+            self._curdir_edit.setText(self.root_path)
             return
-        if path.endswith("/") and path != "/":
-            path = path[:-1]
         self._previous_path = self.root_path
         self.root_path = path
         self._update_ui()
 
     def _move_up(self):
-        self._change_root_path(path=os.path.split(self.root_path)[:-1][0])
+        self._change_root_path(path=os.path.dirname(self.root_path))
 
     def _go_home(self):
         self._change_root_path(path=os.path.expanduser("~"))
@@ -345,11 +381,16 @@ class FileBrowser(QtWidgets.QWidget):
         self._change_root_path(path=path)
 
     def _update_ui(self):
+        # Setting the root path of the tree view is expensive, hence defer
+        # it to coalesce changes of the path in quick succession.
         self._curdir_edit.setText(self.root_path)
-        self._tree_view.set_root_path(self.root_path)
+        self._navigation_timer.start()
         self._back_button.setEnabled(bool(self._previous_path))
         self._forward_button.setEnabled(bool(self._next_path))
 
+    def _apply_root_path(self):
+        self._tree_view.set_root_path(self.root_path)
+
 
 class _FileTree(QtWidgets.QTreeView):
     """
@@ -369,6 +410,11 @@ class _FileTree(QtWidgets.QTreeView):
     Double-clicking on a directory will change the root path to this
     directory.
 
+    Only the column with the file names is displayed, as the purpose of
+    the widget is to select files, and all rows have the same height.
+    Both allow the view to skip calculating the size of each and every
+    cell, speeding up display of large directories considerably.
+
     The class emits two signals described below.
 
     Parameters
@@ -377,9 +423,6 @@ class _FileTree(QtWidgets.QTreeView):
         Root path to be set for the file browser
 
 
-    .. todo::
-        Properly handle hiding of columns, using :meth:`self.hideColumn(#)`.
-
     .. todo::
         Context menu, allowing to set the columns to be displayed?
 
@@ -406,14 +449,45 @@ class _FileTree(QtWidgets.QTreeView):
         super().__init__()
         self._root_path = root_path
         self._model = _FileSystemModel()
+        self._updates_timer = QtCore.QTimer(self)
+        self._selection_timer = QtCore.QTimer(self)
+        self._is_dir_cache = {}
+        self._path_cache = {}
+        self._selected_paths = {}
         self._setup_ui()
 
+    @property
+    def selection(self):
+        """
+        Names of the currently selected files.
+
+        Returns
+        -------
+        selection : :class:`list`
+            Names of the currently selected files, in order of selection
+
+        """
+        return list(self._selected_paths)
+
     def _setup_ui(self):
         self._model.rootPathChanged.connect(self._root_path_changed)
+        self._model.rowsAboutToBeRemoved.connect(self._clear_caches)
+        self._model.modelAboutToBeReset.connect(self._clear_caches)
+        self._model.layoutAboutToBeChanged.connect(self._clear_caches)
+        self._model.directoryLoaded.connect(self._directory_loaded)
+        self._model.modelReset.connect(self._sync_selection)
+        self._updates_timer.setSingleShot(True)
+        self._updates_timer.setInterval(1000)
+        self._updates_timer.timeout.connect(self._enable_updates)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(16)
+        self._selection_timer.timeout.connect(self._emit_selection)
         self.setModel(self._model)
 
         self.set_root_path(self._root_path)
-        # self.hideColumn(1)
+        for column in range(1, self._model.columnCount()):
+            self.hideColumn(column)
+        self.setUniformRowHeights(True)
 
         self.setExpandsOnDoubleClick(False)
         # noinspection PyUnresolvedReferences
@@ -426,6 +500,11 @@ class _FileTree(QtWidgets.QTreeView):
         """
         Set the root path of the directory tree view.
 
+        Setting the root path of the underlying model is rather expensive,
+        as the model reads the directory and watches it for changes.
+        Hence, if the path is identical to the current root path of the
+        model, only the root index of the view is set.
+
         Parameters
         ----------
         path : :class:`str`
@@ -434,9 +513,108 @@ class _FileTree(QtWidgets.QTreeView):
         """
         if not path:
             return
+        if os.path.normpath(path) == os.path.normpath(self._model.rootPath()):
+            self.setRootIndex(self._model.index(self._model.rootPath()))
+            return
+        self._is_dir_cache.clear()
+        self.setUpdatesEnabled(False)
+        self._updates_timer.start()
         self._model.setRootPath(path)
         self.setRootIndex(self._model.index(self._model.rootPath()))
 
+    def _directory_loaded(self, path=""):
+        """
+        Handle "directoryLoaded" signal of the underlying model.
+
+        The underlying model populates a directory asynchronously,
+        inserting the entries in batches. To not repaint the view for each
+        of these batches, updates of the view are disabled when setting a
+        new root path (see :meth:`set_root_path`) and only enabled again
+        once the contents of the root path have been loaded.
+
+        As a safeguard in case the signal is never emitted for the root
+        path (*e.g.*, as it cannot be read), updates get enabled again
+        after a timeout in any case.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            Path whose contents have been loaded
+
+        """
+        if path == self._model.rootPath():
+            self._enable_updates()
+
+    def _enable_updates(self):
+        self._updates_timer.stop()
+        self.setUpdatesEnabled(True)
+
+    def _path(self, index=QtCore.QModelIndex()):
+        """
+        Return the path of the item with the given index.
+
+        The model assembles the path from the path of each parent item
+        every time. Hence, paths are cached, using the internal ID of the
+        index as key. As this ID refers to the corresponding node of the
+        model, the cache is cleared whenever nodes are removed from the
+        model or the model is reset or changes its layout.
+
+        Parameters
+        ----------
+        index : :class:`QtCore.QModelIndex`
+            Index of the item
+
+        Returns
+        -------
+        path : :class:`str`
+            Path of the item
+
+        """
+        key = index.internalId()
+        path = self._path_cache.get(key)
+        if path is None:
+            path = self._model.filePath(index)
+            self._path_cache[key] = path
+        return path
+
+    def _clear_caches(self, *_):
+        self._path_cache.clear()
+        self._is_dir_cache.clear()
+
+    def _is_dir(self, index=QtCore.QModelIndex()):
+        """
+        Check whether the item with the given index is a directory.
+
+        The check is performed for every index during selection, *e.g.*
+        when selecting a range of items with the mouse. Hence, results are
+        cached per path. The cache gets cleared when setting a new root
+        path, and whenever rows are removed from the underlying model or
+        the model is reset or changes its layout, as a file may have been
+        replaced by a directory with the same name or vice versa.
+
+        An invalid index (*e.g.*, when clicking on empty space in the
+        view) is never considered a directory.
+
+        Parameters
+        ----------
+        index : :class:`QtCore.QModelIndex`
+            Index of the item
+
+        Returns
+        -------
+        is_dir : :class:`bool`
+            Whether the item is a directory
+
+        """
+        if not index.isValid():
+            return False
+        path = self._path(index)
+        is_dir = self._is_dir_cache.get(path)
+        if is_dir is None:
+            is_dir = self._model.isDir(index)
+            self._is_dir_cache[path] = is_dir
+        return is_dir
+
     def _double_clicked(self, index=QtCore.QModelIndex()):
         """
         Handle double-click events on items.
@@ -454,8 +632,8 @@ class _FileTree(QtWidgets.QTreeView):
             Index of the selected item
 
         """
-        if self._model.fileInfo(index).isDir():
-            self.set_root_path(self._model.filePath(index))
+        if self._is_dir(index):
+            self.set_root_path(self._path(index))
 
     def _root_path_changed(self, path=""):
         """
@@ -501,7 +679,7 @@ class _FileTree(QtWidgets.QTreeView):
             Event sent during selection.
 
         """
-        if self._model.fileInfo(index).isDir():
+        if self._is_dir(index):
             # noinspection PyUnresolvedReferences
             return QtCore.QItemSelectionModel.Deselect
         return super().selectionCommand(index, event)
@@ -514,6 +692,17 @@ class _FileTree(QtWidgets.QTreeView):
         filenames (with their full path) corresponding to the currently
         selected items.
 
+        The list of selected files is updated incrementally, using only
+        the items (de)selected with this change, rather than collecting
+        all selected items each time. Hence, the names appear in the order
+        the items have been selected.
+
+        As selecting a range of items (*e.g.*, using the keyboard) results
+        in a series of changes of the selection in quick succession,
+        the signal is not emitted immediately, but via a single-shot timer
+        (see :meth:`_emit_selection`). Hence, only one signal is emitted
+        for changes occurring within a few milliseconds.
+
         Afterwards, the super method is called and the parameters passed to
         this method.
 
@@ -526,20 +715,107 @@ class _FileTree(QtWidgets.QTreeView):
             Deselected item
 
         """
-        selected_rows = []
-        for index in self.selectedIndexes():
-            item = self._model.filePath(index)
-            if item not in selected_rows:
-                selected_rows.append(item)
-        self.selection_changed.emit(selected_rows)
+        for index in deselected.indexes():
+            if index.column() == 0:
+                self._selected_paths.pop(self._path(index), None)
+        for index in selected.indexes():
+            if index.column() == 0:
+                self._selected_paths[self._path(index)] = None
+        self._selection_timer.start()
         super().selectionChanged(selected, deselected)
 
+    def _sync_selection(self):
+        """
+        Collect the list of selected files anew from the selection model.
+
+        Whenever the selection changes without :meth:`selectionChanged`
+        being called, *e.g.* upon resetting the model, the list of selected
+        files cannot be updated incrementally. Querying the selected rows
+        rather than the selected indexes returns only one index per item
+        regardless of the number of columns.
+        """
+        self._selected_paths = dict.fromkeys(
+            self._path(index)
+            for index in self.selectionModel().selectedRows(0)
+        )
+        self._selection_timer.start()
+
+    def _emit_selection(self):
+        """
+        Emit the list of filenames corresponding to the selected items.
+
+        Gets called by the single-shot timer started upon changes of the
+        selection (see :meth:`selectionChanged`).
+        """
+        self.selection_changed.emit(self.selection)
+
+    def viewportEvent(self, event):  # noqa N802
+        """
+        Handle events of the viewport of the tree view.
+
+        Tooltip events are handled by displaying the name of the item
+        below the mouse cursor as tooltip, as names may be too long to be
+        displayed in full within the tree view. All other events are
+        passed to the super method.
+
+        Parameters
+        ----------
+        event : :class:`QtCore.QEvent`
+            Event sent to the viewport
+
+        Returns
+        -------
+        handled : :class:`bool`
+            Whether the event has been handled
+
+        """
+        if event.type() == QtCore.QEvent.ToolTip:
+            index = self.indexAt(event.pos())
+            if index.isValid():
+                QtWidgets.QToolTip.showText(
+                    event.globalPos(),
+                    self._model.data(index, QtCore.Qt.DisplayRole),
+                    self.viewport(),
+                    self.visualRect(index),
+                )
+            else:
+                QtWidgets.QToolTip.hideText()
+            return True
+        return super().viewportEvent(event)
+
     def apply_settings(self, model_settings):
+        """
+        Apply settings to the underlying model.
+
+        For details of the settings, see :attr:`FileBrowser.model_settings`.
+
+        Changing the name filters of the model results in filtering all
+        entries anew. Hence, filters are only set if they differ from
+        those currently set.
+
+        Parameters
+        ----------
+        model_settings : :class:`dict`
+            Settings for the underlying model
+
+        """
         if "filters" in model_settings:
-            self._model.setNameFilters(model_settings["filters"])
+            filters = list(model_settings["filters"])
+            if filters != self._model.nameFilters():
+                self._model.setNameFilters(filters)
         if "filter_disables" in model_settings:
-            self._model.setNameFilterDisables(
-                model_settings["filter_disables"]
+            filter_disables = bool(model_settings["filter_disables"])
+            if filter_disables != self._model.nameFilterDisables():
+                self._model.setNameFilterDisables(filter_disables)
+        if "icons" in model_settings:
+            if model_settings["icons"]:
+                self._model.setIconProvider(self._model.default_icon_provider)
+            else:
+                self._model.setIconProvider(None)
+        if "watch" in model_settings:
+            self._model.setOption(
+                self._model.Option.DontWatchForChanges,
+                not model_settings["watch"],
             )
 
 
@@ -547,32 +823,27 @@ class _FileSystemModel(QtWidgets.QFileSystemModel):
     """
     Model of the file system used in the tree view.
 
-    Basically, the class is identical to its base class, currently just
-    adding the relevant code for displaying tooltips.
-    """
+    Basically, the class is identical to its base class. Note that tooltips
+    are handled by the tree view (see :meth:`_FileTree.viewportEvent`),
+    as reimplementing :meth:`data` would route each and every request for
+    data, *e.g.* during painting, through Python.
 
-    # noinspection PyUnresolvedReferences,PyMethodOverriding
-    def data(self, index, role):
-        """
-        Text or else used to display the selected item in the given context.
+    Custom icons of directories are not used, as looking them up requires
+    reading additional files for every directory.
 
-        Parameters
-        ----------
-        index : :class:`QtCore.QModelIndex`
-            Index of the selected item
+    Attributes
+    ----------
+    default_icon_provider : :class:`PySide6.QtGui.QAbstractFileIconProvider`
+        Icon provider originally set for the model
 
-        role : :class:`int`
-            The Qt role deciding about the context
+        Required to restore the icon provider after having set none.
 
-        Returns
-        -------
-        data : :class:`Any`
-            Data used to display the item
+    """
 
-        """
-        if role == QtCore.Qt.ToolTipRole:
-            role = QtCore.Qt.DisplayRole
-        return super().data(index, role)
+    def __init__(self):
+        super().__init__()
+        self.setOption(self.Option.DontUseCustomDirectoryIcons)
+        self.default_icon_provider = self.iconProvider()
 
 
 class _MainWindow(QtWidgets.QMainWindow):
@@ -157,10 +157,33 @@ the settings of organisation and application name on the application level.
 For details, see the :func:`app.main` function in the :mod:`app` module.
 
 To this end, a private method :meth:`MainWindow._restore_settings` gets
-called from the constructor to restore the settings, and the
+called when showing the window for the first time to restore the settings
+(see :meth:`MainWindow.showEvent`), and the
 :meth.`MainWindow.closeEvent` method is overridden to take care of saving
 the current settings on closing the GUI.
 
+Both methods use the same :class:`PySide6.QtCore.QSettings` object,
+created once in the constructor and stored in the non-public attribute
+``_settings``. If you need to save and restore further settings in your own
+``MainWindow`` class, use this object as well rather than creating new
+ones.
+
+The format of the settings file depends on the platform as well, *e.g.*
+the registry on Windows. If you prefer a plain INI file on all platforms,
+set the default format once in your ``main()`` function before creating
+the main window:
+
+
+.. code-block::
+
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+
+
+Restoring and saving geometry and state of the main window can be disabled
+by setting the value ``MainWindow/RestoreGeometry`` in the settings file to
+``false``. This may be useful, *e.g.*, for setups with changing monitor
+configurations or kiosk-mode applications.
+
 
 Adding menus
 ------------
@@ -187,10 +210,13 @@ is best explained with an example:
 
 .. code-block::
 
+    quit_shortcut = QtGui.QKeySequence(QtGui.QKeySequence.Quit)
+    if quit_shortcut.isEmpty():
+        quit_shortcut = "Ctrl+Q"
     file_quit_action = self._create_action(
         "&Quit",
         self.close,
-        QtGui.QKeySequence.Quit or "Ctrl+Q",
+        quit_shortcut,
         "file_quit",
         "Close the application"
     )
@@ -202,6 +228,21 @@ including the keyboard accelerator character. The second argument is the
 actual method being called, followed by the keyboard shortcut, a name for an
 icon file (entirely optional), and finally an explaining text used as
 tooltip in case of a toolbar and shown in the status bar in case of a menu.
+Note that standard key sequences such as ``QKeySequence.Quit`` are empty on
+some platforms (*e.g.*, Windows), hence the fallback in the example above.
+Icons are loaded only once and shared between all actions using the same
+icon.
+
+The slot is connected to the ``triggered`` signal of the action. If you
+need to connect to a different signal, *e.g.* ``toggled`` for a checkable
+action, connect the slot yourself to the action returned:
+
+
+.. code-block::
+
+    action = self._create_action("&Grid", checkable=True)
+    action.toggled.connect(self._toggle_grid)
+
 
 Qt actions are defined once and can be used in different contexts: You can
 add them to a menu, to a context menu, and to a toolbar. Depending on your
@@ -213,6 +254,32 @@ A further convenience method helping to add actions to menus is
 :meth:`MainWindow._add_actions`. Here, you can not only provide a list of
 actions, but "None" as well that will be converted to separators.
 
+The "File" and "Help" menus are accessible as non-public attributes
+``_file_menu`` and ``_help_menu``, respectively, besides the ``_view_menu``.
+In case you need to change the entries of an existing menu, *e.g.* for a
+list of recently opened files, use :meth:`MainWindow._rebuild_menu` rather
+than creating a new menu each time.
+
+Menus with many entries (and icons) take time to be created, although the
+user may never open them. Therefore, you can create a menu lazily using
+:meth:`MainWindow._add_lazy_menu`, providing a method that populates the
+menu the first time it is about to be shown:
+
+
+.. code-block::
+
+    def _create_tools_menu(self):
+        self._add_lazy_menu("&Tools", self._populate_tools_menu)
+
+    def _populate_tools_menu(self, menu):
+        self._add_actions(menu, (self._create_action(...), ...))
+
+
+Note that keyboard shortcuts of actions only become available once the
+respective menu has been populated. Hence, for menus containing actions
+with keyboard shortcuts, such as the "File" and "Help" menus created by
+default, use the standard way of creating menus.
+
 
 Adding dockable windows
 -----------------------
@@ -292,6 +359,28 @@ same docking area. Otherwise, the first one will "win" and drag the second
 one to the same docking area.
 
 
+Dock windows containing complex widgets can be expensive to create,
+although the user may not show them at all. In this case, you can add a
+dock window lazily using :meth:`MainWindow._add_lazy_dock_window`,
+providing a callable returning the dock window rather than the dock
+window itself:
+
+
+.. code-block::
+
+    self._add_lazy_dock_window(
+        lambda: GeneralDockWindow(...),
+        "general 1",
+        Qt.LeftDockWidgetArea
+    )
+
+
+This adds an entry to the View menu, and the dock window is only created
+once the user selects this entry. Note that geometry and state of dock
+windows created lazily cannot be restored on startup, as they do not exist
+at that time.
+
+
 Preventing loss of work on closing the GUI
 ------------------------------------------
 
@@ -320,11 +409,15 @@ Module documentation
 
 """
 
+import sys
+
 from PySide6 import QtGui, QtWidgets
-from PySide6.QtCore import SIGNAL, QSettings, QByteArray, QSize, Qt
+from PySide6.QtCore import QSettings, QByteArray, QSize, Qt
 
 from qtbricks import utils, aboutdialog
 
+_EMPTY_BYTE_ARRAY = QByteArray()
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """
@@ -351,6 +444,9 @@ class MainWindow(QtWidgets.QMainWindow):
     application level. For details, see the :func:`app.main` function in the
     :mod:`app` module.
 
+    Restoring (and saving) geometry and state can be disabled by setting the
+    key ``MainWindow/RestoreGeometry`` to ``false`` in the settings file.
+
     Attributes
     ----------
     package_name : :class:`str`
@@ -363,25 +459,61 @@ class MainWindow(QtWidgets.QMainWindow):
 
         The logo is used, *i.a.*, for the Help About window.
 
+    Both attributes are class attributes, hence you may simply override them
+    in the class body of your own ``MainWindow`` class.
+
     """
 
+    package_name = "qtbricks"
+    logo = utils.image_path("icon.svg")
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.package_name = "qtbricks"
-        self.logo = utils.image_path("icon.svg")
-
+        self._file_menu = None
         self._view_menu = None
+        self._help_menu = None
+        self._dock_windows = {}
+        self._about_dialog = None
+        self._settings = QSettings()
+        self._settings_restored = False
+        self._saved_geometry = _EMPTY_BYTE_ARRAY
+        self._saved_state = _EMPTY_BYTE_ARRAY
 
         self._setup_ui()
-        self._restore_settings()
+
+    def showEvent(self, event):  # noqa N802
+        """
+        Actions performed when showing the window.
+
+        When the window is shown for the first time, geometry and state of
+        the main window are restored from the settings file. Restoring the
+        settings only once the entire window has been created and is about
+        to be shown results in the layout being computed only once.
+        """
+        if not self._settings_restored:
+            self._settings_restored = True
+            self._restore_settings()
+        super().showEvent(event)
 
     def _restore_settings(self):
-        settings = QSettings()
-        self.restoreGeometry(
-            settings.value("MainWindow/Geometry", QByteArray())
+        if not self._restore_geometry_enabled():
+            return
+        self._saved_geometry = self._settings.value(
+            "MainWindow/Geometry", _EMPTY_BYTE_ARRAY
+        )
+        self._saved_state = self._settings.value(
+            "MainWindow/State", _EMPTY_BYTE_ARRAY
+        )
+        if not self._saved_geometry.isEmpty():
+            self.restoreGeometry(self._saved_geometry)
+        if not self._saved_state.isEmpty():
+            self.restoreState(self._saved_state)
+
+    def _restore_geometry_enabled(self):
+        return self._settings.value(
+            "MainWindow/RestoreGeometry", True, type=bool
         )
-        self.restoreState(settings.value("MainWindow/State", QByteArray()))
 
     def _setup_ui(self):
         """
@@ -435,16 +567,19 @@ class MainWindow(QtWidgets.QMainWindow):
         pass
 
     def _create_file_menu(self):
-        # noinspection PyUnresolvedReferences
+        # The standard key sequence for quitting is empty on some platforms
+        quit_shortcut = QtGui.QKeySequence(QtGui.QKeySequence.Quit)
+        if quit_shortcut.isEmpty():
+            quit_shortcut = "Ctrl+Q"
         file_quit_action = self._create_action(
             "&Quit",
             self.close,
-            QtGui.QKeySequence.Quit or "Ctrl+Q",
+            quit_shortcut,
             "file_quit",
             "Close the application",
         )
-        file_menu = self.menuBar().addMenu("&File")
-        self._add_actions(file_menu, (file_quit_action,))
+        self._file_menu = self.menuBar().addMenu("&File")
+        self._add_actions(self._file_menu, (file_quit_action,))
 
     def _create_view_menu(self):
         self._view_menu = self.menuBar().addMenu("&View")
@@ -453,8 +588,68 @@ class MainWindow(QtWidgets.QMainWindow):
         help_about_action = self._create_action(
             "&About", self.help_about, "F1", "", "About the application"
         )
-        help_menu = self.menuBar().addMenu("&Help")
-        self._add_actions(help_menu, (help_about_action,))
+        self._help_menu = self.menuBar().addMenu("&Help")
+        self._add_actions(self._help_menu, (help_about_action,))
+
+    def _add_lazy_menu(self, title="", populate=None):
+        """
+        Add a menu to the menu bar that gets populated on first display.
+
+        Parameters
+        ----------
+        title : :class:`str`
+            Title of the menu, including the keyboard accelerator character
+
+        populate : :class:`callable`
+            Method populating the menu
+
+            Gets called with the menu as sole argument the first time the
+            menu is about to be shown.
+
+        Returns
+        -------
+        menu : :class:`PySide6.QtWidgets.QMenu`
+            Menu added to the menu bar
+
+        """
+        menu = self.menuBar().addMenu(title)
+
+        def _populate():
+            menu.aboutToShow.disconnect(_populate)
+            populate(menu)
+
+        menu.aboutToShow.connect(_populate)
+        return menu
+
+    def _rebuild_menu(self, menu=None, actions=None):
+        """
+        Replace the entries of an existing menu.
+
+        Menus with changing entries, *e.g.* a list of recently opened
+        files, should be kept and repopulated rather than created anew.
+        Submenus and actions owned by the menu are deleted, as they would
+        otherwise accumulate with each rebuild. Actions created using
+        :meth:`_create_action` are owned by the main window and hence kept,
+        so that they can be reused.
+
+        Parameters
+        ----------
+        menu : :class:`PySide6.QtWidgets.QMenu`
+            Menu to rebuild
+
+        actions : :class:`collections.abc.Iterable`
+            Actions to add to the menu
+
+            See :meth:`_add_actions` for details.
+
+        """
+        for action in menu.actions():
+            if action.menu():
+                action.menu().deleteLater()
+            if action.parent() is menu:
+                action.deleteLater()
+        menu.clear()
+        self._add_actions(menu, actions)
 
     # pylint: disable=too-many-arguments
     def _create_action(
@@ -465,40 +660,161 @@ class MainWindow(QtWidgets.QMainWindow):
         icon=None,
         tip=None,
         checkable=False,
-        signal="triggered()",
     ):
         action = QtGui.QAction(text, self)
         if icon:
-            action.setIcon(QtGui.QIcon(utils.image_path(f"{icon}.png")))
+            action.setIcon(utils.cached_icon(utils.image_path(f"{icon}.png")))
         if shortcut:
             action.setShortcut(shortcut)
         if tip:
             action.setToolTip(tip)
             action.setStatusTip(tip)
         if slot:
-            # noinspection PyTypeChecker
-            self.connect(action, SIGNAL(signal), slot)
+            action.triggered.connect(slot)
         if checkable:
             action.setCheckable(True)
         return action
 
     @staticmethod
     def _add_actions(target, actions):
+        """
+        Add actions to a target, converting ``None`` to separators.
+
+        Consecutive actions are added in one go, using the
+        :meth:`addActions` method of the target.
+
+        Parameters
+        ----------
+        target : :class:`PySide6.QtWidgets.QWidget`
+            Target to add the actions to, *e.g.* a menu or toolbar
+
+        actions : :class:`collections.abc.Iterable`
+            Actions to add
+
+            ``None`` entries are converted to separators. Any iterable can
+            be used, including generators.
+
+        """
+        add_actions = target.addActions
+        add_separator = target.addSeparator
+        consecutive_actions = []
         for action in actions:
             if action is None:
-                target.addSeparator()
+                if consecutive_actions:
+                    add_actions(consecutive_actions)
+                    consecutive_actions = []
+                add_separator()
             else:
-                target.addAction(action)
+                consecutive_actions.append(action)
+        if consecutive_actions:
+            add_actions(consecutive_actions)
 
     def _add_dock_window(
         self, dock_window=None, title="", area=Qt.RightDockWidgetArea
     ):
+        """
+        Add a dock window to the main window and an entry to the View menu.
+
+        Dock windows are registered by their object name. Adding a dock
+        window with the same object name as one added before returns the
+        dock window added before, rather than adding a duplicate. The dock
+        window passed in this case is scheduled for deletion (unless it has
+        a parent), hence use the returned dock window only.
+
+        Parameters
+        ----------
+        dock_window : :class:`PySide6.QtWidgets.QDockWidget`
+            Dock window to add
+
+        title : :class:`str`
+            Title of the dock window
+
+            If empty, the title of the dock window is not changed.
+
+        area : :class:`PySide6.QtCore.Qt.DockWidgetArea`
+            Area the dock window is added to
+
+        Returns
+        -------
+        dock_window : :class:`PySide6.QtWidgets.QDockWidget`
+            Dock window added to the main window
+
+        """
+        object_name = dock_window.objectName()
+        if object_name in self._dock_windows:
+            existing_dock_window = self._dock_windows[object_name]
+            if (
+                dock_window is not existing_dock_window
+                and dock_window.parent() is None
+            ):
+                dock_window.deleteLater()
+            return existing_dock_window
         if title:
-            dock_window.setTitle(title)
+            dock_window.setWindowTitle(title)
         self.addDockWidget(area, dock_window)
         self._view_menu.addAction(dock_window.toggleViewAction())
+        if object_name:
+            self._dock_windows[object_name] = dock_window
         return dock_window
 
+    def _add_lazy_dock_window(
+        self, factory=None, title="", area=Qt.RightDockWidgetArea
+    ):
+        """
+        Add an entry to the View menu creating a dock window on activation.
+
+        Once created, the dock window is registered by its object name, as
+        with :meth:`_add_dock_window`. If a dock window with the same object
+        name has been added in the meantime, the latter is shown instead.
+
+        Parameters
+        ----------
+        factory : :class:`callable`
+            Callable returning the dock window
+
+            Gets called only once, the first time the user activates the
+            entry in the View menu.
+
+        title : :class:`str`
+            Title of the dock window, used for the entry in the View menu
+
+        area : :class:`PySide6.QtCore.Qt.DockWidgetArea`
+            Area the dock window is added to
+
+        Returns
+        -------
+        action : :class:`PySide6.QtGui.QAction`
+            Entry added to the View menu
+
+            Gets replaced by the toggle view action of the dock window once
+            the latter has been created.
+
+        """
+        action = QtGui.QAction(title, self)
+        action.setCheckable(True)
+
+        def _create_dock_window():
+            action.triggered.disconnect(_create_dock_window)
+            dock_window = factory()
+            object_name = dock_window.objectName()
+            if object_name in self._dock_windows:
+                self._add_dock_window(dock_window).show()
+                self._view_menu.removeAction(action)
+                return
+            if title:
+                dock_window.setWindowTitle(title)
+            self.addDockWidget(area, dock_window)
+            self._view_menu.insertAction(
+                action, dock_window.toggleViewAction()
+            )
+            self._view_menu.removeAction(action)
+            if object_name:
+                self._dock_windows[object_name] = dock_window
+
+        action.triggered.connect(_create_dock_window)
+        self._view_menu.addAction(action)
+        return action
+
     def help_about(self):
         """
         Show a dialog with basic information about the application.
@@ -508,11 +824,14 @@ class MainWindow(QtWidgets.QMainWindow):
         a license information, and some very basic system settings,
         is a sensible thing to do. Typically, this can be found in the "Help
         -> About" menu.
+
+        The dialog is created only once and reused afterwards.
         """
-        dialog = aboutdialog.AboutDialog(
-            parent=self, package_name=self.package_name, logo=self.logo
-        )
-        dialog.exec()
+        if self._about_dialog is None:
+            self._about_dialog = aboutdialog.AboutDialog(
+                parent=self, package_name=self.package_name, logo=self.logo
+            )
+        self._about_dialog.exec()
 
     def closeEvent(self, event):  # noqa N802
         """
@@ -520,12 +839,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
         By default, both geometry and state of the main window are saved to
         the settings file, to be restored on startup, using the standard Qt
-        machinery for this purpose.
+        machinery for this purpose. Settings are only written if they
+        changed compared to the settings restored on startup, and not at
+        all if restoring settings has been disabled.
         """
         if self._ok_to_continue():
-            settings = QSettings()
-            settings.setValue("MainWindow/Geometry", self.saveGeometry())
-            settings.setValue("MainWindow/State", self.saveState())
+            if not self._restore_geometry_enabled():
+                return
+            geometry = self.saveGeometry()
+            if geometry != self._saved_geometry:
+                self._settings.setValue("MainWindow/Geometry", geometry)
+                self._saved_geometry = geometry
+            state = self.saveState()
+            if state != self._saved_state:
+                self._settings.setValue("MainWindow/State", state)
+                self._saved_state = state
         else:
             event.ignore()
 
@@ -639,6 +967,7 @@ def _main():
     app.setOrganizationDomain("example.org")
     app.setApplicationName("Demo application")
     app.setWindowIcon(QtGui.QIcon(utils.image_path("icon.svg")))
+    QSettings.setDefaultFormat(QSettings.IniFormat)
 
     window = MainWindow()
     window.show()
@@ -646,6 +975,4 @@ def _main():
 
 
 if __name__ == "__main__":
-    import sys
-
     _main()
@@ -68,10 +68,13 @@ expected.
 Notes for developers
 ====================
 
-TBD
+Zooming with the mouse wheel is implemented in the figure canvas, centred
+around the current mouse position. Each zoom step is pushed to the
+navigation history of the (invisible) Matplotlib navigation toolbar, hence
+the "back" and "home" buttons work as expected.
 
 .. todo::
-    Implement mouse wheel for zooming (& panning) in Matplotlib canvas.
+    Implement panning with the mouse wheel in Matplotlib canvas.
 
     https://stackoverflow.com/questions/11551049/
 
@@ -80,13 +83,12 @@ Module documentation
 ====================
 
 """
-import collections.abc
 import sys
 
 import numpy as np
 
 # Import PySide6 before matplotlib
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 
 from matplotlib import figure, widgets
 from matplotlib.backends import backend_qtagg as backend
@@ -192,7 +194,7 @@ class Plot(QtWidgets.QWidget):
             self._canvas.draw_idle()
 
     def _setup_ui(self, figure_canvas):
-        mpl_toolbar = backend.NavigationToolbar2QT(figure_canvas, None)
+        mpl_toolbar = _NavigationToolbar(figure_canvas)
         home_button = utils.create_button(
             icon="house.svg",
             shortcut="h",
@@ -261,16 +263,19 @@ class Plot(QtWidgets.QWidget):
         )
 
         controls_layout = QtWidgets.QHBoxLayout()
-        controls_layout.addWidget(home_button)
-        controls_layout.addWidget(back_button)
-        controls_layout.addWidget(forward_button)
-        controls_layout.addWidget(zoom_button)
-        controls_layout.addWidget(pan_button)
-        controls_layout.addWidget(crosshair_button)
-        controls_layout.addWidget(grid_button)
-        controls_layout.addWidget(subplots_button)
-        controls_layout.addWidget(customise_button)
-        controls_layout.addWidget(save_button)
+        for button in (
+            home_button,
+            back_button,
+            forward_button,
+            zoom_button,
+            pan_button,
+            crosshair_button,
+            grid_button,
+            subplots_button,
+            customise_button,
+            save_button,
+        ):
+            controls_layout.addWidget(button)
         controls_layout.addStretch()
         layout = QtWidgets.QVBoxLayout()
         layout.addLayout(controls_layout)
@@ -278,6 +283,29 @@ class Plot(QtWidgets.QWidget):
         self.setLayout(layout)
 
 
+class _NavigationToolbar(backend.NavigationToolbar2QT):
+    """
+    Navigation toolbar without any actions providing navigation functions.
+
+    The :class:`Plot` widget comes with its own buttons, but uses the
+    functionality of the Matplotlib navigation toolbar, such as zooming,
+    panning, and the navigation history. Hence, this toolbar creates
+    neither actions with icons nor a label for the coordinates, as these
+    would never be shown anyway.
+
+    Parameters
+    ----------
+    canvas : :class:`matplotlib.backend_bases.FigureCanvasBase`
+        Figure canvas the toolbar operates on
+
+    """
+
+    toolitems = []
+
+    def __init__(self, canvas=None):
+        super().__init__(canvas, None, coordinates=False)
+
+
 class _FigureCanvas(backend.FigureCanvasQTAgg):
     """
     Figure canvas containing the Matplotlib figure for use within Qt GUIs.
@@ -287,55 +315,166 @@ class _FigureCanvas(backend.FigureCanvasQTAgg):
     figure : :class:`matplotlib.figure.Figure`
         Matplotlib figure containing the actual plot
 
-    axes : :class:`matplotlib.axes.Axes`
-        Matplotlib axes for plotting data
+    zoom_factor : :class:`float`
+        Factor the view limits get scaled with for one step of the mouse
+        wheel when zooming in.
+
+        Default: 0.9
 
     """
 
+    zoom_factor = 0.9
+
     def __init__(self):
-        self.figure = figure.Figure()  # figsize=(width, height), dpi=dpi
+        super().__init__(figure.Figure())  # figsize=(width, height), dpi=dpi
+        self._axes = None
+        self._axes_list = []
         self.axes = self.figure.add_subplot(111)
-        super().__init__(self.figure)
 
         self._cursor = None
-        self._background = None
-        self._grid = None
+        self._cursor_connections = []
+        self._motion_event = None
+        self._motion_timer = QtCore.QTimer(self)
+        self._motion_timer.setSingleShot(True)
+        self._motion_timer.setInterval(16)
+        self._motion_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._motion_timer.timeout.connect(self._move_cursor)
+        self._grid = False
+        self.mpl_connect("scroll_event", self._zoom)
+
+    @property
+    def axes(self):
+        """
+        Matplotlib axes for plotting data.
+
+        Can be either a single axes object or an array of axes, as returned
+        by :meth:`matplotlib.figure.Figure.subplots`. Internally, the axes
+        are additionally stored as flat list upon setting them.
+
+        Returns
+        -------
+        axes : :class:`matplotlib.axes.Axes`
+
+        """
+        return self._axes
+
+    @axes.setter
+    def axes(self, axes):
+        self._axes = axes
+        self._axes_list = list(np.atleast_1d(axes).flat)
 
     def toggle_crosshair_cursor(self):
+        """
+        Toggle display of a crosshair cursor following the mouse.
+
+        The cursor uses blitting: The lines of the cursor are animated
+        artists, and for each mouse move, only these lines are drawn on top
+        of the background saved upon the last full draw of the canvas,
+        rather than redrawing the entire figure.
+
+        Furthermore, the cursor is updated at most every 16 ms (*i.e.*,
+        with about 60 Hz), regardless of how many mouse move events arrive
+        in the meantime. Only the most recent position is used (see
+        :meth:`_move_cursor`).
+        """
         if self._cursor:
-            for hline in self._cursor.hlines:
-                hline.remove()
-            for vline in self._cursor.vlines:
-                vline.remove()
+            self._motion_timer.stop()
+            self._motion_event = None
+            for connection in self._cursor_connections:
+                self.mpl_disconnect(connection)
+            self._cursor_connections = []
+            for line in self._cursor.hlines + self._cursor.vlines:
+                line.remove()
             self._cursor = None
-            # noinspection PyUnresolvedReferences
-            self.restore_region(self._background)
-            self.blit(self.figure.bbox)
         else:
-            # noinspection PyUnresolvedReferences
-            self._background = self.figure.canvas.copy_from_bbox(
-                self.figure.bbox
-            )
-            if isinstance(self.axes, collections.abc.Iterable):
-                axes = self.axes
-            else:
-                axes = [self.axes]
             self._cursor = widgets.MultiCursor(
                 canvas=None,
-                axes=axes,
-                useblit=False,
+                axes=self._axes_list,
+                useblit=True,
                 horizOn=True,
                 vertOn=True,
                 color="red",
                 linewidth=1,
             )
+            self._cursor.disconnect()
+            self._cursor_connections = [
+                self.mpl_connect("motion_notify_event", self._queue_motion),
+                self.mpl_connect("draw_event", self._cursor.clear),
+            ]
+        # Full draw to get rid of the cursor or save the background, resp.
+        self.draw_idle()
 
-    def toggle_grid(self):
-        if isinstance(self.axes, collections.abc.Iterable):
-            for axes in self.axes:
-                axes.grid(visible=self._grid)
-        else:
-            self.axes.grid(visible=self._grid)
+    def _queue_motion(self, event):
+        self._motion_event = event
+        if not self._motion_timer.isActive():
+            self._motion_timer.start()
+
+    def _move_cursor(self):
+        """
+        Move the crosshair cursor to the most recent mouse position.
+
+        Gets called by the single-shot timer started upon mouse move events
+        (see :meth:`toggle_crosshair_cursor`). Hence, all mouse move events
+        arriving in the meantime are dropped except the last one.
+        """
+        if self._cursor and self._motion_event:
+            self._cursor.onmove(self._motion_event)
+        self._motion_event = None
+
+    def _zoom(self, event):
+        """
+        Zoom the axes below the mouse cursor upon scrolling the mouse wheel.
+
+        Scrolling up zooms in, scrolling down zooms out, keeping the data
+        position below the mouse cursor fixed. Zooming takes place in the
+        scale of the respective axis, hence works with, *e.g.*, logarithmic
+        axes as well.
+
+        As changing the view limits changes ticks and tick labels as well,
+        the canvas is redrawn via :meth:`draw_idle`, coalescing wheel
+        events in quick succession into one draw.
+        """
+        axes = event.inaxes
+        if axes is None:
+            return
+        if self.toolbar:
+            self.toolbar.push_current()
+        factor = self.zoom_factor**event.step
+        for axis, limits, centre, set_limits in (
+            (axes.xaxis, axes.get_xlim(), event.xdata, axes.set_xlim),
+            (axes.yaxis, axes.get_ylim(), event.ydata, axes.set_ylim),
+        ):
+            transform = axis.get_transform()
+            lower, upper, centre = transform.transform([*limits, centre])
+            limits = [
+                centre + (lower - centre) * factor,
+                centre + (upper - centre) * factor,
+            ]
+            set_limits(transform.inverted().transform(limits))
+        self.draw_idle()
+
+    def toggle_grid(self, visible=None):
+        """
+        Toggle display of a grid in all axes.
+
+        The canvas is only redrawn if the visibility of the grid actually
+        changed.
+
+        Parameters
+        ----------
+        visible : :class:`bool`
+            Whether the grid should be visible.
+
+            If not provided, the current visibility is inverted.
+
+        """
+        if visible is None:
+            visible = not self._grid
+        if visible == self._grid:
+            return
+        self._grid = visible
+        for axes in self._axes_list:
+            axes.grid(visible=self._grid)
         self.draw_idle()
 
 
@@ -347,12 +486,13 @@ class _MainWindow(QtWidgets.QMainWindow):
         self.setCentralWidget(widget)
 
         time = np.linspace(0, 4 * np.pi, 501)
-        widget.axes.plot(time, np.sin(time), ".")
+        signal = np.sin(time)
+        widget.axes.plot(time, signal, ".")
 
         widget.figure.clf()
 
         widget.axes = widget.figure.subplots(2, 1)
-        widget.axes[0].plot(time, np.sin(time), ".")
+        widget.axes[0].plot(time, signal, ".")
 
         self.show()
 
@@ -17,7 +17,7 @@ import unittest
 from PySide6 import QtCore, QtTest, QtWidgets
 
 
-def qtest_enter_text(widget=None, text=""):
+def qtest_enter_text(widget=None, text="", typed=True):
     """
     Convenience function to enter text in a QLineEdit widget.
 
@@ -31,6 +31,14 @@ def qtest_enter_text(widget=None, text=""):
 
     For convenience, this function takes care of all three steps.
 
+    By default, the text is typed key by key, as a user would do. Hence,
+    validators, input masks and the maximum length of the widget apply,
+    and the ``textEdited`` signal is emitted. If you only need the final
+    text and want to avoid one key event per character, *e.g.* for long
+    texts, set ``typed`` to ``False``. In this case, the text is set at
+    once, bypassing validators and input masks, and no ``textEdited``
+    signal is emitted.
+
     Parameters
     ----------
     widget : :class:`PySide6.QtWidgets.QLineEdit`
@@ -39,9 +47,17 @@ def qtest_enter_text(widget=None, text=""):
     text : :class:`str`
         Text to enter into the widget.
 
+    typed : :class:`bool`
+        Whether to type the text key by key.
+
+        Default: True
+
     """
     widget.clear()
-    QtTest.QTest.keyClicks(widget, text)
+    if typed:
+        QtTest.QTest.keyClicks(widget, text)
+    else:
+        widget.setText(text)
     QtTest.QTest.keyPress(widget, QtCore.Qt.Key.Key_Return)
 
 
@@ -49,6 +65,10 @@ class SignalReceiver:
     """
     Context manager class detecting whether a QSignal has been emitted.
 
+    Emissions are recorded by a :class:`PySide6.QtTest.QSignalSpy`, hence
+    within Qt's signal machinery and without calling back into Python for
+    every emission of the signal.
+
     Adapted from https://stackoverflow.com/a/48128768
     """
 
@@ -58,25 +78,11 @@ class SignalReceiver:
         self.called = False
         self.expected_args = args
         self.actual_args = None
-
-    def slot(self, *args):
-        """
-        Slot connected to the signal to test for.
-
-        If the signal is emitted, the attribute :attr:`called` is set to True.
-
-        Parameters
-        ----------
-        args
-            Parameters passed by the emitted signal.
-
-        """
-        self.actual_args = args
-        self.called = True
+        self._spy = None
 
     def __enter__(self):
         """Entrance of the context manager."""
-        self.signal.connect(self.slot)
+        self._spy = QtTest.QSignalSpy(self.signal)
 
     def __exit__(self, exception, msg, traceback):
         """
@@ -96,7 +102,10 @@ class SignalReceiver:
         """
         if exception:
             raise exception(msg)
+        count = self._spy.count()
+        self.called = count > 0
         self.test.assertTrue(self.called, "Signal not called!")
+        self.actual_args = tuple(self._spy.at(count - 1))
         if self.actual_args:
             self.test.assertEqual(
                 self.expected_args,
@@ -111,6 +120,8 @@ class SignalNotReceiver:
     """
     Context manager class detecting whether a QSignal has not been emitted.
 
+    Emissions are recorded by a :class:`PySide6.QtTest.QSignalSpy`.
+
     Adapted from https://stackoverflow.com/a/48128768
     """
 
@@ -118,18 +129,11 @@ class SignalNotReceiver:
         self.test = test
         self.signal = signal
         self.called = False
-
-    def slot(self):
-        """
-        Slot connected to the signal to test for.
-
-        If the signal is emitted, the attribute :attr:`called` is set to True.
-        """
-        self.called = True
+        self._spy = None
 
     def __enter__(self):
         """Entrance of the context manager."""
-        self.signal.connect(self.slot)
+        self._spy = QtTest.QSignalSpy(self.signal)
 
     def __exit__(self, exception, msg, traceback):
         """
@@ -149,6 +153,7 @@ class SignalNotReceiver:
         """
         if exception:
             raise exception(msg)
+        self.called = self._spy.count() > 0
         self.test.assertFalse(self.called, "Signal called!")
 
 
@@ -156,19 +161,19 @@ class TestCaseUsingQSignals(unittest.TestCase):
     """
     Test class for testing whether a QSignal has been emitted.
 
+    The QApplication instance is created (if necessary) once per test class
+    and available as class attribute :attr:`app`.
+
     Adapted from https://stackoverflow.com/a/48128768
     """
 
-    def setUp(self):
-        """Create the QApplication instance"""
-        _instance = QtWidgets.QApplication.instance()
-        if not _instance:
-            _instance = QtWidgets.QApplication([])
-        self.app = _instance
-
-    def tearDown(self):
-        """Delete the reference owned by self"""
-        del self.app
+    @classmethod
+    def setUpClass(cls):  # noqa N802
+        """Create the QApplication instance shared by all tests"""
+        super().setUpClass()
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(
+            []
+        )
 
     def assertSignalReceived(self, signal, args):  # noqa N802
         """
@@ -7,11 +7,15 @@ qtbricks, hence generally the individual functions are designed with
 reusability beyond the qtbricks package in mind.
 """
 
+import functools
 import os
 
 from PySide6 import QtWidgets, QtGui
 
+_PACKAGE_DIR = os.path.dirname(__file__)
 
+
+@functools.lru_cache(maxsize=256)
 def image_path(name="", image_dir="images", base_dir=""):
     """
     Return full path to a given image.
@@ -26,6 +30,9 @@ def image_path(name="", image_dir="images", base_dir=""):
     For use with own packages, you may want to set the parameter
     ``base_dir`` accordingly.
 
+    As the same few images get looked up over and over again, the paths
+    are memoized.
+
     Parameters
     ----------
     name : :class:`str`
@@ -50,11 +57,39 @@ def image_path(name="", image_dir="images", base_dir=""):
         Full path to the icon
 
     """
-    base_dir = base_dir or os.path.dirname(__file__)
+    base_dir = base_dir or _PACKAGE_DIR
     path = os.path.join(base_dir, image_dir, name)
     return path
 
 
+@functools.lru_cache(maxsize=None)
+def cached_icon(path=""):
+    """
+    Return icon for the given image file, creating it only once.
+
+    Icons are shared between all widgets using the same image file,
+    hence the image file needs to be read and parsed only once. Use this
+    function whenever setting icons from image files, *e.g.* in
+    combination with :func:`image_path`:
+
+    .. code-block::
+
+        button.setIcon(cached_icon(image_path("house.svg")))
+
+    Parameters
+    ----------
+    path : :class:`str`
+        Full path to the image file
+
+    Returns
+    -------
+    icon : :class:`PySide6.QtGui.QIcon`
+        Icon created from the image file
+
+    """
+    return QtGui.QIcon(path)
+
+
 # pylint: disable=too-many-arguments
 def create_button(
     text="", slot=None, shortcut="", icon="", checkable=False, tooltip=""
@@ -105,12 +140,12 @@ def create_button(
     """
     button = QtWidgets.QPushButton(text)
     if icon:
-        button.setIcon(QtGui.QIcon(image_path(icon)))
+        button.setIcon(cached_icon(image_path(icon)))
     if shortcut:
         button.setShortcut(shortcut)
     if tooltip:
         if shortcut:
-            tooltip = "\n".join([tooltip, f"Keyboard shortcut: {shortcut}"])
+            tooltip = f"{tooltip}\nKeyboard shortcut: {shortcut}"
         button.setToolTip(tooltip)
     if slot:
         if checkable:
@@ -137,10 +172,10 @@ def make_buttons_in_group_uncheckable(buttongroup):
 
     """
     buttongroup.buttonPressed.connect(
-        lambda button: button.group().setExclusive(not button.isChecked())
+        lambda button: buttongroup.setExclusive(not button.isChecked())
     )
     buttongroup.buttonClicked.connect(
-        lambda button: button.group().setExclusive(True)
+        lambda button: buttongroup.setExclusive(True)
     )
 
 
@@ -186,8 +221,9 @@ class IntValidator(QtGui.QIntValidator):
             Value that has been fixed.
 
         """
-        if int(value) > self.top():
-            value = str(self.top())
-        if int(value) < self.bottom():
-            value = str(self.bottom())
+        number = int(value)
+        if number > self.top():
+            return str(self.top())
+        if number < self.bottom():
+            return str(self.bottom())
         return value
@@ -1,6 +1,8 @@
+import os
+import tempfile
 import unittest
 
-from PySide6 import QtCore, QtWidgets, QtTest
+from PySide6 import QtCore, QtGui, QtWidgets, QtTest
 
 from qtbricks import aboutdialog, testing
 
@@ -33,6 +35,65 @@ class TestDatasetDisplayWidget(unittest.TestCase):
         )
         self.assertTrue(close_button)
 
+    def test_debug_info_is_empty_before_showing_tab(self):
+        self.assertFalse(self.widget._tab_debug_info.toPlainText())
+
+    def test_showing_dialog_sets_about_text(self):
+        self.assertFalse(self.widget._tab_about.text())
+        self.widget.show()
+        self.assertIn(self.package_name, self.widget._tab_about.text())
+
+    def test_logo_is_scaled_to_height(self):
+        self.widget.show()
+        logo = self.widget._top_layout.itemAt(0).widget()
+        self.assertEqual(60, logo.pixmap().height())
+
+    def test_small_raster_logo_is_scaled_up_to_height(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logo.png")
+            image = QtGui.QImage(32, 16, QtGui.QImage.Format_RGB32)
+            image.fill(QtCore.Qt.red)
+            image.save(path)
+            self.widget.logo = path
+            pixmap = self.widget._logo_pixmap(height=60)
+        self.assertEqual(QtCore.QSize(120, 60), pixmap.size())
+
+    def test_about_text_is_selectable(self):
+        self.assertTrue(
+            self.widget._tab_about.textInteractionFlags()
+            & QtCore.Qt.TextSelectableByMouse
+        )
+
+    def test_long_authors_text_is_scrollable(self):
+        self.widget.show()
+        self.widget._package_metadata = {
+            "Author": ", ".join(f"Author {number}" for number in range(100)),
+            "License": "BSD",
+        }
+        self.widget._tab_authors.setText(self.widget._create_authors_text())
+        self.widget._tab_widget.setCurrentWidget(
+            self.widget._scroll_area_authors
+        )
+        QtTest.QTest.qWait(50)
+        scroll_bar = self.widget._scroll_area_authors.verticalScrollBar()
+        self.assertGreater(scroll_bar.maximum(), 0)
+
+    def test_authors_text_contains_all_authors(self):
+        self.widget._package_metadata = {
+            "Author": "John Doe, Jane Doe",
+            "License": "BSD",
+        }
+        authors_text = self.widget._create_authors_text()
+        self.assertIn("<li>John Doe</li>", authors_text)
+        self.assertIn("<li>Jane Doe</li>", authors_text)
+
+    def test_showing_debug_info_tab_sets_debug_info(self):
+        self.widget.show()
+        self.widget._tab_widget.setCurrentWidget(self.widget._tab_debug_info)
+        self.assertIn(
+            self.package_name, self.widget._tab_debug_info.toPlainText()
+        )
+
 
 class TestDatasetDisplayWidgetSignals(testing.TestCaseUsingQSignals):
     def setUp(self):
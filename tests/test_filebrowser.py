@@ -1,8 +1,9 @@
+import os
 import unittest
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtWidgets, QtTest
 
-from qtbricks import filebrowser
+from qtbricks import filebrowser, testing
 
 
 class TestFileBrowser(unittest.TestCase):
@@ -10,7 +11,9 @@ class TestFileBrowser(unittest.TestCase):
         self.app = (
             QtWidgets.QApplication.instance() or QtWidgets.QApplication()
         )
-        self.widget = filebrowser.FileBrowser()
+        self.widget = filebrowser.FileBrowser(
+            path=os.path.dirname(os.path.abspath(__file__))
+        )
         self.addCleanup(self.release_qt_resources)
 
     def release_qt_resources(self):
@@ -20,3 +23,86 @@ class TestFileBrowser(unittest.TestCase):
 
     def test_instantiate_class(self):
         pass
+
+    def test_tree_view_is_updated_after_loading_directory(self):
+        QtTest.QTest.qWait(500)
+        self.assertTrue(self.widget._tree_view.updatesEnabled())
+
+    def test_selecting_file_sets_selection(self):
+        QtTest.QTest.qWait(500)
+        tree_view = self.widget._tree_view
+        index = tree_view._model.index(os.path.abspath(__file__))
+        tree_view.selectionModel().select(
+            index, QtCore.QItemSelectionModel.ClearAndSelect
+        )
+        QtTest.QTest.qWait(50)
+        self.assertEqual([os.path.abspath(__file__)], self.widget.selection)
+
+    def test_entering_path_with_trailing_separator_keeps_root_path(self):
+        root_path = self.widget.root_path
+        testing.qtest_enter_text(
+            self.widget._curdir_edit, root_path + os.path.sep
+        )
+        self.assertEqual(root_path, self.widget.root_path)
+        self.assertFalse(self.widget._previous_path)
+
+    def test_entering_nonexisting_path_reverts_path(self):
+        root_path = self.widget.root_path
+        testing.qtest_enter_text(
+            self.widget._curdir_edit, os.path.join(root_path, "foo", "bar")
+        )
+        self.assertEqual(root_path, self.widget._curdir_edit.text())
+
+    def test_deselecting_file_removes_file_from_selection(self):
+        QtTest.QTest.qWait(500)
+        tree_view = self.widget._tree_view
+        index = tree_view._model.index(os.path.abspath(__file__))
+        tree_view.selectionModel().select(
+            index, QtCore.QItemSelectionModel.Select
+        )
+        tree_view.selectionModel().select(
+            index, QtCore.QItemSelectionModel.Deselect
+        )
+        QtTest.QTest.qWait(50)
+        self.assertEqual([], self.widget.selection)
+
+    def test_clicking_empty_space_clears_selection(self):
+        self.widget.resize(400, 2000)
+        self.widget.show()
+        QtTest.QTest.qWait(500)
+        tree_view = self.widget._tree_view
+        index = tree_view._model.index(os.path.abspath(__file__))
+        tree_view.selectionModel().select(
+            index, QtCore.QItemSelectionModel.ClearAndSelect
+        )
+        QtTest.QTest.qWait(50)
+        viewport = tree_view.viewport()
+        position = QtCore.QPoint(10, viewport.height() - 10)
+        self.assertFalse(tree_view.indexAt(position).isValid())
+        QtTest.QTest.mouseClick(
+            viewport, QtCore.Qt.MouseButton.LeftButton, pos=position
+        )
+        QtTest.QTest.qWait(50)
+        self.assertEqual([], self.widget.selection)
+
+    def test_changing_model_layout_clears_is_dir_cache(self):
+        QtTest.QTest.qWait(500)
+        tree_view = self.widget._tree_view
+        tree_view._is_dir(tree_view._model.index(os.path.abspath(__file__)))
+        tree_view._model.layoutAboutToBeChanged.emit()
+        self.assertFalse(tree_view._is_dir_cache)
+
+    def test_disabling_watch_sets_model_option(self):
+        self.widget.model_settings = {"watch": False}
+        model = self.widget._tree_view.model()
+        self.assertTrue(model.testOption(model.Option.DontWatchForChanges))
+
+    def test_moving_up_sets_root_path_of_tree_view_deferred(self):
+        QtTest.QTest.qWait(500)
+        path = os.path.dirname(self.widget.root_path)
+        self.widget._up_button.click()
+        self.assertEqual(path, self.widget.root_path)
+        QtTest.QTest.qWait(100)
+        self.assertEqual(
+            path, os.path.normpath(self.widget._tree_view._model.rootPath())
+        )
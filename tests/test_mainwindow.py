@@ -1,6 +1,6 @@
 import unittest
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtTest, QtWidgets
 
 from qtbricks import mainwindow
 
@@ -21,6 +21,115 @@ class TestMainWindow(unittest.TestCase):
     def test_instantiate_class(self):
         pass
 
+    def test_settings_are_not_restored_before_showing_window(self):
+        self.assertFalse(self.window._settings_restored)
+
+    def test_showing_window_restores_settings(self):
+        self.window.show()
+        self.assertTrue(self.window._settings_restored)
+
+    def test_quit_action_has_shortcut(self):
+        action = self.window._file_menu.actions()[0]
+        self.assertFalse(action.shortcut().isEmpty())
+
+    def test_triggering_action_calls_slot(self):
+        calls = []
+        action = self.window._create_action(
+            "&Foo", lambda: calls.append(True)
+        )
+        action.trigger()
+        self.assertTrue(calls)
+
+    def test_add_actions_converts_none_to_separators(self):
+        menu = QtWidgets.QMenu()
+        actions = [QtGui.QAction("foo"), None, QtGui.QAction("bar")]
+        self.window._add_actions(menu, actions)
+        self.assertEqual(3, len(menu.actions()))
+        self.assertTrue(menu.actions()[1].isSeparator())
+
+    def test_add_actions_accepts_generator(self):
+        menu = QtWidgets.QMenu()
+        actions = [QtGui.QAction("foo"), QtGui.QAction("bar")]
+        self.window._add_actions(menu, (action for action in actions))
+        self.assertEqual(2, len(menu.actions()))
+
+    def test_rebuild_menu_replaces_actions(self):
+        actions = [QtGui.QAction("foo"), QtGui.QAction("bar")]
+        self.window._rebuild_menu(self.window._file_menu, actions)
+        self.assertEqual(actions, self.window._file_menu.actions())
+
+    def test_add_dock_window_sets_title(self):
+        dock_window = mainwindow.GeneralDockWindow(object_name="Foo")
+        self.window._add_dock_window(dock_window, title="Bar")
+        self.assertEqual("Bar", dock_window.windowTitle())
+
+    def test_add_dock_window_twice_adds_only_one_dock_window(self):
+        dock_window = mainwindow.GeneralDockWindow(object_name="Foo")
+        self.window._add_dock_window(dock_window)
+        other = self.window._add_dock_window(
+            mainwindow.GeneralDockWindow(object_name="Foo")
+        )
+        self.assertIs(dock_window, other)
+        self.assertEqual(1, len(self.window._view_menu.actions()))
+
+    def test_add_dock_window_twice_deletes_rejected_dock_window(self):
+        self.window._add_dock_window(
+            mainwindow.GeneralDockWindow(object_name="Foo")
+        )
+        duplicate = mainwindow.GeneralDockWindow(object_name="Foo")
+        destroyed = QtTest.QSignalSpy(duplicate.destroyed)
+        self.window._add_dock_window(duplicate)
+        self.app.sendPostedEvents(event_type=QtCore.QEvent.DeferredDelete)
+        self.assertEqual(1, destroyed.count())
+
+    def test_lazy_dock_window_is_created_on_activation(self):
+        dock_windows = []
+
+        def factory():
+            dock_windows.append(mainwindow.GeneralDockWindow())
+            return dock_windows[-1]
+
+        action = self.window._add_lazy_dock_window(factory, "Foo")
+        self.assertFalse(dock_windows)
+        action.trigger()
+        self.assertEqual(1, len(dock_windows))
+        self.assertIn(
+            dock_windows[0].toggleViewAction(),
+            self.window._view_menu.actions(),
+        )
+        self.assertNotIn(action, self.window._view_menu.actions())
+
+    def test_add_dock_window_after_lazy_dock_window_adds_no_duplicate(self):
+        dock_window = mainwindow.GeneralDockWindow(object_name="Foo")
+        action = self.window._add_lazy_dock_window(lambda: dock_window)
+        action.trigger()
+        other = self.window._add_dock_window(
+            mainwindow.GeneralDockWindow(object_name="Foo")
+        )
+        self.assertIs(dock_window, other)
+        self.assertEqual(1, len(self.window._view_menu.actions()))
+
+    def test_lazy_dock_window_reuses_existing_dock_window(self):
+        dock_window = mainwindow.GeneralDockWindow(object_name="Foo")
+        self.window._add_dock_window(dock_window)
+        action = self.window._add_lazy_dock_window(
+            lambda: mainwindow.GeneralDockWindow(object_name="Foo")
+        )
+        action.trigger()
+        self.assertEqual(
+            [dock_window.toggleViewAction()],
+            self.window._view_menu.actions(),
+        )
+
+    def test_lazy_menu_is_populated_on_first_display(self):
+        menu = self.window._add_lazy_menu(
+            "&Foo", lambda target: target.addAction("bar")
+        )
+        self.assertFalse(menu.actions())
+        menu.aboutToShow.emit()
+        menu.aboutToShow.emit()
+        self.assertEqual(1, len(menu.actions()))
+
 
 class TestGeneralDockWindow(unittest.TestCase):
     def setUp(self):
@@ -1,6 +1,7 @@
 import unittest
 
-from PySide6 import QtCore, QtWidgets
+from matplotlib import backend_bases
+from PySide6 import QtCore, QtTest, QtWidgets
 
 from qtbricks import plot
 
@@ -20,3 +21,91 @@ class TestPlot(unittest.TestCase):
 
     def test_instantiate_class(self):
         pass
+
+    def test_navigation_toolbar_has_no_actions(self):
+        self.assertFalse(self.widget._canvas.toolbar.actions())
+
+    def test_axes_belong_to_figure(self):
+        self.assertIs(self.widget.figure, self.widget.axes.figure)
+
+    def test_toggle_crosshair_cursor_uses_blitting(self):
+        self.widget._canvas.toggle_crosshair_cursor()
+        self.assertTrue(self.widget._canvas._cursor.useblit)
+
+    def test_toggle_crosshair_cursor_twice_removes_cursor_lines(self):
+        self.widget._canvas.toggle_crosshair_cursor()
+        self.widget._canvas.toggle_crosshair_cursor()
+        self.assertFalse(self.widget.axes.lines)
+
+    def test_toggle_grid_shows_grid(self):
+        self.widget._canvas.toggle_grid()
+        self.assertTrue(
+            self.widget.axes.xaxis.get_gridlines()[0].get_visible()
+        )
+
+    def test_toggle_grid_twice_hides_grid(self):
+        self.widget._canvas.toggle_grid()
+        self.widget._canvas.toggle_grid()
+        self.assertFalse(
+            self.widget.axes.xaxis.get_gridlines()[0].get_visible()
+        )
+
+    def test_toggle_grid_with_unchanged_visibility_keeps_grid(self):
+        self.widget._canvas.toggle_grid(True)
+        self.widget._canvas.toggle_grid(True)
+        self.assertTrue(
+            self.widget.axes.xaxis.get_gridlines()[0].get_visible()
+        )
+
+    def test_mouse_moves_in_quick_succession_move_cursor_once(self):
+        canvas = self.widget._canvas
+        canvas.toggle_crosshair_cursor()
+        moves = []
+        canvas._cursor.onmove = moves.append
+        for position in ((10, 10), (20, 20), (30, 30)):
+            canvas._queue_motion(position)
+        QtTest.QTest.qWait(50)
+        self.assertEqual([(30, 30)], moves)
+
+    def test_toggle_grid_with_array_of_axes_shows_grid_in_all_axes(self):
+        self.widget.figure.clf()
+        self.widget.axes = self.widget.figure.subplots(2, 2)
+        self.widget._canvas.toggle_grid()
+        for axes in self.widget.axes.flat:
+            self.assertTrue(axes.xaxis.get_gridlines()[0].get_visible())
+
+    def scroll(self, step=1, position=(0.5, 0.5)):
+        canvas = self.widget._canvas
+        x, y = self.widget.axes.transData.transform(position)
+        event = backend_bases.MouseEvent(
+            "scroll_event", canvas, x, y, step=step
+        )
+        canvas.callbacks.process("scroll_event", event)
+
+    def test_scroll_up_zooms_in_around_mouse_position(self):
+        self.widget.axes.set_xlim(0, 1)
+        self.widget.axes.set_ylim(0, 1)
+        self.scroll(step=1, position=(0.5, 0.5))
+        self.assertAlmostEqual(0.05, self.widget.axes.get_xlim()[0])
+        self.assertAlmostEqual(0.95, self.widget.axes.get_ylim()[1])
+
+    def test_scroll_on_log_axis_zooms_in_scale_space(self):
+        self.widget.axes.set_xscale("log")
+        self.widget.axes.set_xlim(1, 1000)
+        self.scroll(step=-1, position=(10, 0.5))
+        self.scroll(step=1, position=(10, 0.5))
+        lower, upper = self.widget.axes.get_xlim()
+        self.assertAlmostEqual(1, lower)
+        self.assertAlmostEqual(1000, upper)
+
+    def test_scroll_down_zooms_out(self):
+        self.widget.axes.set_xlim(0, 1)
+        self.scroll(step=-1, position=(0, 0.5))
+        self.assertAlmostEqual(0, self.widget.axes.get_xlim()[0])
+        self.assertGreater(self.widget.axes.get_xlim()[1], 1)
+
+    def test_scroll_pushes_view_to_navigation_history(self):
+        self.widget.axes.set_xlim(0, 1)
+        self.scroll()
+        self.widget._canvas.toolbar.back()
+        self.assertEqual((0, 1), self.widget.axes.get_xlim())
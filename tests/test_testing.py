@@ -1,6 +1,6 @@
 import unittest
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from qtbricks import testing
 
@@ -29,6 +29,22 @@ class TestQtestEnterText(unittest.TestCase):
         testing.qtest_enter_text(widget=self.widget, text=text)
         self.assertEqual(text, self.widget.text())
 
+    def test_qtest_enter_text_applies_validator(self):
+        self.widget.setValidator(QtGui.QIntValidator(0, 100))
+        self.widget.setMaxLength(3)
+        testing.qtest_enter_text(widget=self.widget, text="abc12345")
+        self.assertEqual("123", self.widget.text())
+
+    def test_qtest_enter_text_emits_text_edited(self):
+        with testing.SignalReceiver(self, self.widget.textEdited, "foo"):
+            testing.qtest_enter_text(widget=self.widget, text="foo")
+
+    def test_qtest_enter_text_without_typing_sets_text(self):
+        text = "Lorem ipsum"
+        self.widget.setText("Bla")
+        testing.qtest_enter_text(widget=self.widget, text=text, typed=False)
+        self.assertEqual(text, self.widget.text())
+
     def test_qtest_enter_text_sends_signals(self):
         def mock_slot():
             self.has_been_called = True
@@ -38,3 +54,31 @@ class TestQtestEnterText(unittest.TestCase):
         self.widget.editingFinished.connect(mock_slot)
         testing.qtest_enter_text(widget=self.widget, text=text)
         self.assertTrue(self.has_been_called)
+
+
+class _Emitter(QtCore.QObject):
+    value_changed = QtCore.Signal(str)
+
+
+class TestTestCaseUsingQSignals(testing.TestCaseUsingQSignals):
+    def setUp(self):
+        super().setUp()
+        self.emitter = _Emitter()
+
+    def test_signal_received_with_args(self):
+        with self.assertSignalReceived(self.emitter.value_changed, "foo"):
+            self.emitter.value_changed.emit("foo")
+
+    def test_signal_received_with_wrong_args_fails(self):
+        with self.assertRaises(AssertionError):
+            with self.assertSignalReceived(self.emitter.value_changed, "foo"):
+                self.emitter.value_changed.emit("bar")
+
+    def test_signal_not_received(self):
+        with self.assertSignalNotReceived(self.emitter.value_changed):
+            pass
+
+    def test_signal_not_received_fails_if_emitted(self):
+        with self.assertRaises(AssertionError):
+            with self.assertSignalNotReceived(self.emitter.value_changed):
+                self.emitter.value_changed.emit("foo")
@@ -1,7 +1,7 @@
 import os
 import unittest
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtTest, QtWidgets
 
 from qtbricks import utils
 
@@ -48,6 +48,50 @@ class TestCreateButton(unittest.TestCase):
         button = utils.create_button()
         self.assertIsInstance(button, QtWidgets.QPushButton)
 
+    def test_create_button_with_icon_sets_icon(self):
+        button = utils.create_button(icon="house.svg")
+        self.assertFalse(button.icon().isNull())
+
+    def test_create_button_with_tooltip_and_shortcut_sets_tooltip(self):
+        button = utils.create_button(tooltip="Foo", shortcut="f")
+        self.assertEqual("Foo\nKeyboard shortcut: f", button.toolTip())
+
+    def test_create_buttons_with_same_icon_share_icon(self):
+        utils.cached_icon.cache_clear()
+        utils.create_button(icon="house.svg")
+        utils.create_button(icon="house.svg")
+        self.assertEqual(1, utils.cached_icon.cache_info().currsize)
+
+
+class TestMakeButtonsInGroupUncheckable(unittest.TestCase):
+    def setUp(self):
+        self.app = (
+            QtWidgets.QApplication.instance() or QtWidgets.QApplication()
+        )
+        self.widget = QtWidgets.QWidget()
+        self.group = QtWidgets.QButtonGroup(self.widget)
+        self.buttons = [utils.create_button(checkable=True) for _ in range(2)]
+        for button in self.buttons:
+            self.group.addButton(button)
+        utils.make_buttons_in_group_uncheckable(self.group)
+        self.addCleanup(self.release_qt_resources)
+
+    def release_qt_resources(self):
+        self.widget.deleteLater()
+        self.app.sendPostedEvents(event_type=QtCore.QEvent.DeferredDelete)
+        self.app.processEvents()
+
+    def test_clicking_checked_button_unchecks_button(self):
+        QtTest.QTest.mouseClick(self.buttons[0], QtCore.Qt.LeftButton)
+        QtTest.QTest.mouseClick(self.buttons[0], QtCore.Qt.LeftButton)
+        self.assertFalse(self.buttons[0].isChecked())
+
+    def test_group_stays_exclusive(self):
+        QtTest.QTest.mouseClick(self.buttons[0], QtCore.Qt.LeftButton)
+        QtTest.QTest.mouseClick(self.buttons[1], QtCore.Qt.LeftButton)
+        self.assertFalse(self.buttons[0].isChecked())
+        self.assertTrue(self.buttons[1].isChecked())
+
 
 class TestIntValidator(unittest.TestCase):
     def setUp(self):
@@ -69,3 +113,7 @@ class TestIntValidator(unittest.TestCase):
             self.validator.fixup(str(42 - 5)),
             str(self.validator.bottom()),
         )
+
+    def test_fixup_with_value_within_boundaries_returns_value(self):
+        self.validator.setRange(0, 42)
+        self.assertEqual("17", self.validator.fixup("17"))